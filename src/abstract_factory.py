@@ -4,31 +4,52 @@ Factory Method Pattern
 
 """
 
+import sys
 from abc import ABC, abstractmethod
 
+_CHEESE = sys.intern("cheese")
+_CLAM = sys.intern("clam")
+
+_BAKE_MSG = "Bake for 25 minutes at 350\n"
+_CUT_MSG = "Cutting the pizza into diagonal slices\n"
+_BOX_MSG = "Place pizza in official PizzaStore box\n"
+
+_NY_VEGGIES = ("Garlic", "Onion", "Mushroom", "RedPepper")
+_CHICAGO_VEGGIES = ("Spinach", "Black Olives", "Eggplant")
+
 
 # Product
 class Pizza(ABC):
-    def __init__(self, name):
+    __slots__ = ("name", "ingredient_factory",
+                 "dough", "sauce", "veggies", "cheese", "pepperoni", "clam")
+
+    # (attribute, ingredient factory method) pairs filled in by `prepare`
+    INGREDIENTS: tuple[tuple[str, str], ...] = ()
+
+    def __init__(self, name, ingredient_factory: "PizzaIngredientFactory"):
         self.name = name
+        self.ingredient_factory = ingredient_factory
         self.dough = None
         self.sauce = None
-        self.veggies = []
+        self.veggies = ()
         self.cheese = None
         self.pepperoni = None
         self.clam = None
 
-    @abstractmethod
-    def prepare(self): pass
+    def prepare(self):
+        sys.stdout.write(f"Preparing {self.name}\n")
+        factory = self.ingredient_factory
+        for attr, method_name in self.INGREDIENTS:
+            setattr(self, attr, getattr(factory, method_name)())
 
     def bake(self):
-        print("Bake for 25 minutes at 350")
+        sys.stdout.write(_BAKE_MSG)
 
     def cut(self):
-        print("Cutting the pizza into diagonal slices")
+        sys.stdout.write(_CUT_MSG)
 
     def box(self):
-        print("Place pizza in official PizzaStore box")
+        sys.stdout.write(_BOX_MSG)
 
 
 class PizzaIngredientFactory(ABC):
@@ -58,7 +79,7 @@ class NYPizzaIngredientFactory(PizzaIngredientFactory):
 
     def create_cheese(self): return "Reggiano Cheese"
 
-    def create_veggies(self): return ["Garlic", "Onion", "Mushroom", "RedPepper"]
+    def create_veggies(self): return _NY_VEGGIES
 
     def create_pepperoni(self): return "Sliced Pepperoni"
 
@@ -72,7 +93,7 @@ class ChicagoIngredientFactory(PizzaIngredientFactory):
 
     def create_cheese(self): return "Shredded Mozzarella Cheese"
 
-    def create_veggies(self): return ["Spinach", "Black Olives", "Eggplant"]
+    def create_veggies(self): return _CHICAGO_VEGGIES
 
     def create_pepperoni(self): return "Sliced Pepperoni"
 
@@ -80,35 +101,56 @@ class ChicagoIngredientFactory(PizzaIngredientFactory):
 
 
 class CheesePizza(Pizza):
-    def __init__(self, ingredient_factory: PizzaIngredientFactory):
-        super().__init__("Cheese Pizza")
-        self.ingredient_factory = ingredient_factory
+    __slots__ = ()
 
-    def prepare(self):
-        print("Preparing ", self.name)
-        self.dough = self.ingredient_factory.create_dough()
-        self.sauce = self.ingredient_factory.create_sauce()
-        self.cheese = self.ingredient_factory.create_cheese()
+    INGREDIENTS = (("dough", "create_dough"),
+                   ("sauce", "create_sauce"),
+                   ("cheese", "create_cheese"))
+
+    def __init__(self, ingredient_factory: PizzaIngredientFactory, style: str = ""):
+        super().__init__(f"{style}{' ' if style else ''}Cheese Pizza", ingredient_factory)
 
 
 class ClamPizza(Pizza):
-    def __init__(self, ingredient_factory: PizzaIngredientFactory):
-        super().__init__("Clam Pizza")
-        self.ingredient_factory = ingredient_factory
+    __slots__ = ()
 
-    def prepare(self):
-        print("Preparing ", self.name)
-        self.dough = self.ingredient_factory.create_dough()
-        self.sauce = self.ingredient_factory.create_sauce()
-        self.cheese = self.ingredient_factory.create_cheese()
-        self.clam = self.ingredient_factory.create_clam()
+    INGREDIENTS = (("dough", "create_dough"),
+                   ("sauce", "create_sauce"),
+                   ("cheese", "create_cheese"),
+                   ("clam", "create_clam"))
+
+    def __init__(self, ingredient_factory: PizzaIngredientFactory, style: str = ""):
+        super().__init__(f"{style}{' ' if style else ''}Clam Pizza", ingredient_factory)
 
 
 # Creator
 class PizzaStore(ABC):
+    # Concrete creators declare which pizzas they make and in which style.
+    # Pizza type keys are normalized to lower case when the subclass is defined.
+    STYLE: str = ""
+    INGREDIENT_FACTORY: PizzaIngredientFactory
+
+    @property
     @abstractmethod
+    def PIZZAS(self) -> dict[str, type[Pizza]]:
+        """Maps pizza types to the pizza classes this store makes."""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        pizzas = cls.__dict__.get("PIZZAS")
+        if isinstance(pizzas, dict):
+            cls.PIZZAS = {sys.intern(name.lower()): ctor for name, ctor in pizzas.items()}
+
     def create_pizza(self, pizza_type: str) -> Pizza:
-        pass
+        ctor = self.PIZZAS.get(pizza_type)
+        if ctor is None:
+            # only pay for lowercasing if the type was not given in canonical form
+            pizza_type = pizza_type.lower()
+            ctor = self.PIZZAS.get(pizza_type)
+            if ctor is None:
+                style = f"{self.STYLE} " if self.STYLE else ""
+                raise ValueError(f"Don't know how to create {style}{pizza_type} pizza")
+        return ctor(self.INGREDIENT_FACTORY, style=self.STYLE)
 
     def order_pizza(self, pizza_type: str) -> Pizza:
         pizza = self.create_pizza(pizza_type)
@@ -123,32 +165,17 @@ class PizzaStore(ABC):
 
 # Concrete Creator
 class NyPizzaStore(PizzaStore):
-    def create_pizza(self, pizza_type: str) -> Pizza:
-        pizza_type = pizza_type.lower()
-        ingredient_factory = NYPizzaIngredientFactory()
-        if pizza_type == "cheese":
-            pizza = CheesePizza(ingredient_factory)
-        elif pizza_type == "clam":
-            pizza = ClamPizza(ingredient_factory)
-        else:
-            raise ValueError(f"Don't know how to create New York style {pizza_type} pizza")
-        pizza.name = "Now York Style" + pizza.name
-        return pizza
+    STYLE = "New York Style"
+    PIZZAS = {_CHEESE: CheesePizza, _CLAM: ClamPizza}
+    # ingredient factories are stateless, so all pizzas can share one
+    INGREDIENT_FACTORY = NYPizzaIngredientFactory()
 
 
 # Concrete Creator
 class ChicagoPizzaStore(PizzaStore):
-    def create_pizza(self, pizza_type: str) -> Pizza:
-        pizza_type = pizza_type.lower()
-        ingredient_factory = ChicagoIngredientFactory()
-        if pizza_type == "cheese":
-            pizza = CheesePizza(ingredient_factory)
-        elif pizza_type == "clam":
-            pizza = ClamPizza(ingredient_factory)
-        else:
-            raise ValueError(f"Don't know how to create Chicago style {pizza_type} pizza")
-        pizza.name = "Chicago Style" + pizza.name
-        return pizza
+    STYLE = "Chicago Style"
+    PIZZAS = {_CHEESE: CheesePizza, _CLAM: ClamPizza}
+    INGREDIENT_FACTORY = ChicagoIngredientFactory()
 
 
 if __name__ == '__main__':
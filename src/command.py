@@ -10,14 +10,23 @@ To make the usage more interesting, I'll implement undoable commands:
   invokes commands and remembers which commands have been invoked in order.
 - The different commands know how to manipulate the text buffer and how to
   undo their actions.
+- Consecutive edits at adjacent positions (e.g. typing character by character)
+  are coalesced into a single command, so they are undone in one step. Call
+  `TextEditor.flush()` to force an undo boundary.
+- The history is bounded; only the most recent `max_history` commands can be
+  undone.
 """
+import sys
 from abc import ABC, abstractmethod
+from collections import deque
+from array import array
 
 
 class TextEditor:
-    def __init__(self, inital_text=''):
+    def __init__(self, inital_text='', max_history=10_000):
         self.text = TextBuffer(inital_text)
-        self.command_history = []
+        self.command_history = deque(maxlen=max_history)
+        self.coalesce = False
 
     def insert(self, at, text):
         cmd = InsertCommand(self.text, at, text)
@@ -30,7 +39,11 @@ class TextEditor:
     def append(self, text):
         self.insert(len(self.text), text)
 
+    def flush(self):
+        self.coalesce = False
+
     def undo(self):
+        self.flush()
         try:
             last_cmd = self.command_history.pop()
         except IndexError:
@@ -39,31 +52,55 @@ class TextEditor:
 
     def execute_command(self, cmd):
         cmd.execute()
-        self.command_history.append(cmd)
+        if not (self.coalesce and self.command_history
+                and self.command_history[-1].merge(cmd)):
+            self.command_history.append(cmd)
+        self.coalesce = True
 
 
 class Command(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def execute(self): pass
 
     @abstractmethod
     def undo(self): pass
 
+    def merge(self, cmd):
+        """Absorb an already executed `cmd` into self, if possible.
+
+        Returns True if `cmd` has been merged and need not be remembered.
+        """
+        return False
+
 
 class InsertCommand(Command):
+    __slots__ = ("text_buffer", "position", "text")
+
     def __init__(self, text_buffer, at, text):
         self.text_buffer = text_buffer
         self.position = at
         self.text = text
 
     def execute(self):
+        self.position = self.text_buffer.clamp_position(self.position)
         self.text_buffer.insert(self.position, self.text)
 
     def undo(self):
         self.text_buffer.delete_range(self.position, len(self.text))
 
+    def merge(self, cmd):
+        if (isinstance(cmd, InsertCommand) and cmd.text_buffer is self.text_buffer
+                and self.position + len(self.text) == cmd.position):
+            self.text += cmd.text
+            return True
+        return False
+
 
 class DeleteCommand(Command):
+    __slots__ = ("text_buffer", "position", "length", "deletion")
+
     def __init__(self, text_buffer, at, length):
         self.text_buffer = text_buffer
         self.position = at
@@ -71,27 +108,101 @@ class DeleteCommand(Command):
         self.deletion = None
 
     def execute(self):
+        self.position = self.text_buffer.clamp_position(self.position)
         self.deletion = self.text_buffer.delete_range(self.position, self.length)
 
     def undo(self):
         assert self.deletion is not None
         self.text_buffer.insert(self.position, self.deletion)
 
+    def merge(self, cmd):
+        if (isinstance(cmd, DeleteCommand) and cmd.text_buffer is self.text_buffer
+                and self.position == cmd.position):
+            self.deletion += cmd.deletion
+            self.length += cmd.length
+            return True
+        return False
+
+
+# Store one 4-byte item per code point, so buffer indices match str indices on
+# every platform (unlike array('u'), which is UTF-16 where wchar_t is 2 bytes).
+_CODE_POINT_TYPECODE = next(code for code in 'IL' if array(code).itemsize == 4)
+_CODE_POINT_CODEC = 'utf-32-le' if sys.byteorder == 'little' else 'utf-32-be'
+
+
+def _encode(text):
+    buf = array(_CODE_POINT_TYPECODE)
+    buf.frombytes(text.encode(_CODE_POINT_CODEC, 'surrogatepass'))
+    return buf
+
+
+def _decode(buf):
+    return buf.tobytes().decode(_CODE_POINT_CODEC, 'surrogatepass')
+
 
 class TextBuffer:
+    """Gap buffer of code points.
+
+    Inserting or deleting near the previous edit only moves the characters
+    between the two positions instead of copying the whole text.
+    """
+
+    __slots__ = ("buf", "gap_start", "gap_end")
+
     def __init__(self, text):
-        self.text = text
+        self.buf = _encode(text)
+        self.gap_start = len(self.buf)
+        self.gap_end = len(self.buf)
+
+    @property
+    def text(self):
+        if self.gap_end == len(self.buf):
+            # the gap is at the end after appending, so there is nothing to join
+            return _decode(self.buf[:self.gap_start])
+        return _decode(self.buf[:self.gap_start] + self.buf[self.gap_end:])
+
+    def _move_gap(self, pos):
+        if pos < self.gap_start:
+            n = self.gap_start - pos
+            self.buf[self.gap_end - n:self.gap_end] = self.buf[pos:self.gap_start]
+            self.gap_start -= n
+            self.gap_end -= n
+        elif pos > self.gap_start:
+            n = pos - self.gap_start
+            self.buf[self.gap_start:pos] = self.buf[self.gap_end:self.gap_end + n]
+            self.gap_start += n
+            self.gap_end += n
+
+    def _grow(self, needed):
+        capacity = len(self.buf)
+        new_capacity = max(2 * capacity, capacity + needed)
+        extra = new_capacity - capacity
+        self.buf[self.gap_end:self.gap_end] = array(_CODE_POINT_TYPECODE, [0]) * extra
+        self.gap_end += extra
+
+    def clamp_position(self, pos):
+        """Normalize `pos` like a str slice index: negative positions count
+        from the end, and the result lies in [0, len(self)]."""
+        return slice(pos, pos).indices(len(self))[0]
 
     def insert(self, at, text):
-        self.text = f'{self.text[:at]}{text}{self.text[at:]}'
+        at = self.clamp_position(at)
+        self._move_gap(at)
+        if self.gap_end - self.gap_start < len(text):
+            self._grow(len(text))
+        self.buf[self.gap_start:self.gap_start + len(text)] = _encode(text)
+        self.gap_start += len(text)
 
     def delete_range(self, start, length):
-        deleted = self.text[start:start + length]
-        self.text = f'{self.text[:start]}{self.text[start + length:]}'
+        start = self.clamp_position(start)
+        length = max(0, min(length, len(self) - start))
+        self._move_gap(start + length)
+        deleted = _decode(self.buf[start:start + length])
+        self.gap_start = start
         return deleted
 
     def __len__(self):
-        return len(self.text)
+        return len(self.buf) - (self.gap_end - self.gap_start)
 
     def __eq__(self, other):
         if isinstance(other, TextBuffer):
@@ -150,6 +261,7 @@ def test_multi_undo():
     ed = TextEditor('')
     ed.append('hello')
     assert ed.text == 'hello'
+    ed.flush()
     ed.append(', earth!')
     assert ed.text == 'hello, earth!'
     ed.undo()
@@ -160,3 +272,94 @@ def test_multi_undo():
     assert ed.text == 'hello'
     ed.undo()
     assert ed.text == ''
+
+
+def test_edits_at_different_positions():
+    ed = TextEditor('world')
+    ed.append('!')
+    ed.insert(0, 'hello ')
+    ed.delete(5, 1)
+    ed.insert(5, ', ')
+    assert ed.text == 'hello, world!'
+    ed.undo()
+    ed.undo()
+    assert ed.text == 'hello world!'
+
+
+def test_undo_coalesced_typing():
+    ed = TextEditor('')
+    for ch in 'hello':
+        ed.append(ch)
+    assert len(ed.command_history) == 1
+    ed.undo()
+    assert ed.text == ''
+
+
+def test_undo_coalesced_forward_delete():
+    ed = TextEditor('hexxxxllo')
+    for _ in range(4):
+        ed.delete(2, 1)
+    assert ed.text == 'hello'
+    assert len(ed.command_history) == 1
+    ed.undo()
+    assert ed.text == 'hexxxxllo'
+
+
+def test_bounded_history():
+    ed = TextEditor('', max_history=2)
+    for word in ['foo', 'bar', 'baz']:
+        ed.append(word)
+        ed.flush()
+    assert len(ed.command_history) == 2
+    ed.undo()
+    ed.undo()
+    ed.undo()
+    assert ed.text == 'foo'
+
+
+def test_non_bmp_characters():
+    ed = TextEditor('a\U0001F600b')
+    assert len(ed.text) == 3
+    ed.insert(2, '\U0001F355')
+    assert ed.text == 'a\U0001F600\U0001F355b'
+    ed.delete(1, 1)
+    assert ed.text == 'a\U0001F355b'
+    ed.undo()
+    assert ed.text == 'a\U0001F600\U0001F355b'
+
+
+def test_insert_out_of_range():
+    buf = TextBuffer('abc')
+    buf.insert(10, 'X')
+    assert buf == 'abcX'
+    assert len(buf) == 4
+    buf.insert(-1, 'Y')
+    assert buf == 'abcYX'
+    buf.insert(-10, 'Z')
+    assert buf == 'ZabcYX'
+
+
+def test_delete_out_of_range():
+    buf = TextBuffer('abc')
+    assert buf.delete_range(5, 2) == ''
+    assert buf == 'abc'
+    assert len(buf) == 3
+    assert buf.delete_range(-2, 1) == 'b'
+    assert buf == 'ac'
+    assert buf.delete_range(1, -3) == ''
+    assert buf == 'ac'
+
+
+def test_undo_out_of_range():
+    ed = TextEditor('abc')
+    ed.insert(10, 'X')
+    ed.undo()
+    assert ed.text == 'abc'
+    ed.insert(-1, 'X')
+    assert ed.text == 'abXc'
+    ed.undo()
+    assert ed.text == 'abc'
+    ed.delete(-1, 1)
+    assert ed.text == 'ab'
+    ed.undo()
+    assert ed.text == 'abc'
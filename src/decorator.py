@@ -7,7 +7,13 @@ straight-forward in Python.
 """
 
 from abc import ABC, abstractmethod
-import math
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
 
 
 class Predictor(ABC):
@@ -29,44 +35,92 @@ class PredictorDecorator(Predictor):
     def predict(self, x): pass
 
 
+# Below this many samples the JIT kernel's dispatch overhead outweighs the
+# saved temporary arrays, so the plain NumPy path is used.
+JIT_MIN_SAMPLES = 10_000
+
+if numba is not None:
+    @numba.njit(cache=True, fastmath=True)
+    def _fit_kernel(x, y):
+        n = x.shape[0]
+        sx = 0.0
+        sy = 0.0
+        for i in range(n):
+            sx += x[i]
+            sy += y[i]
+        mean_x = sx / n
+        mean_y = sy / n
+        sxy = 0.0
+        sxx = 0.0
+        for i in range(n):
+            dx = x[i] - mean_x
+            sxy += dx * (y[i] - mean_y)
+            sxx += dx * dx
+        if sxx == 0.0:
+            raise ZeroDivisionError("cannot fit a line to x values without variance")
+        slope = sxy / sxx
+        return slope, mean_y - slope * mean_x
+else:
+    _fit_kernel = None
+
+
 class LinearPredictor(Predictor):
     def __init__(self):
         self.slope = 0
         self.offset = 0
 
     def fit(self, x, y):
-        mean_x = sum(x) / len(x)
-        mean_y = sum(y) / len(y)
-        sos_xy = sum((xi - mean_x) * (yi - mean_y) for xi, yi in zip(x, y))
-        sos_x = sum((xi - mean_x) ** 2 for xi in x)
-        self.slope = sos_xy / sos_x
-        self.offset = mean_y - self.slope * mean_x
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        if x.shape != y.shape:
+            # the JIT kernel does no bounds checking, so validate up front
+            raise ValueError(f"x and y must have the same shape, got {x.shape} and {y.shape}")
+        if _fit_kernel is not None and len(x) >= JIT_MIN_SAMPLES:
+            self.slope, self.offset = _fit_kernel(x, y)
+            return self
+        mean_x = x.mean()
+        mean_y = y.mean()
+        dx = x - mean_x
+        sos_x = (dx * dx).sum()
+        if sos_x == 0:
+            raise ZeroDivisionError("cannot fit a line to x values without variance")
+        self.slope = float((dx * (y - mean_y)).sum() / sos_x)
+        self.offset = float(mean_y - self.slope * mean_x)
         return self
 
     def predict(self, x):
-        return [self.offset + self.slope * xi for xi in x]
+        return (self.offset + self.slope * np.asarray(x, dtype=np.float64)).tolist()
 
 
 class LogYDecorator(PredictorDecorator):
     def fit(self, x, y):
-        logy = [math.log(yi) for yi in y]
+        logy = np.log(np.asarray(y, dtype=np.float64))
         self.decorated_predictor.fit(x, logy)
         return self
 
     def predict(self, x):
-        logy = self.decorated_predictor.predict(x)
-        return [math.exp(yi) for yi in logy]
+        inner = self.decorated_predictor
+        if type(inner).predict is LinearPredictor.predict:
+            # fuse the affine map and exp without an intermediate list
+            logy = inner.offset + inner.slope * np.asarray(x, dtype=np.float64)
+        else:
+            logy = np.asarray(inner.predict(x), dtype=np.float64)
+        return np.exp(logy).tolist()
 
 
 class LogXDecorator(PredictorDecorator):
     def fit(self, x, y):
-        logx = [math.log(xi) for xi in x]
+        logx = np.log(np.asarray(x, dtype=np.float64))
         self.decorated_predictor.fit(logx, y)
         return self
 
     def predict(self, x):
-        logx = [math.log(xi) for xi in x]
-        return self.decorated_predictor.predict(logx)
+        logx = np.log(np.asarray(x, dtype=np.float64))
+        inner = self.decorated_predictor
+        if type(inner).predict is LinearPredictor.predict:
+            # fuse log and the affine map without an intermediate list
+            return (inner.offset + inner.slope * logx).tolist()
+        return inner.predict(logx)
 
 
 if __name__ == '__main__':
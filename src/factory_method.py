@@ -4,8 +4,18 @@ Factory Method Pattern
 
 """
 
+import sys
 from abc import ABC, abstractmethod
 
+_CHEESE = sys.intern("cheese")
+
+
+_BAKE_MSG = "Bake for 25 minutes at 350\n"
+_CUT_MSG = "Cutting the pizza into diagonal slices\n"
+_BOX_MSG = "Place pizza in official PizzaStore box\n"
+_PREPARE_MSG = "Tossing dough...\nAdding sauce...\nAdding toppings:\n"
+_SQUARE_CUT_MSG = "Cutting the pizza into square slices\n"
+
 
 # Product
 class Pizza(ABC):
@@ -16,28 +26,67 @@ class Pizza(ABC):
         self.toppings = toppings
 
     def prepare(self):
-        print(f"Preparing {self.name}")
-        print("Tossing dough...")
-        print("Adding sauce...")
-        print("Adding toppings:")
-        for topping in self.toppings:
-            print("   ", topping)
+        toppings = "".join(f"    {topping}\n" for topping in self.toppings)
+        sys.stdout.write(f"Preparing {self.name}\n{_PREPARE_MSG}{toppings}")
 
     def bake(self):
-        print("Bake for 25 minutes at 350")
+        sys.stdout.write(_BAKE_MSG)
 
     def cut(self):
-        print("Cutting the pizza into diagonal slices")
+        sys.stdout.write(_CUT_MSG)
 
     def box(self):
-        print("Place pizza in official PizzaStore box")
+        sys.stdout.write(_BOX_MSG)
+
+
+# Concrete Product
+class NyStyleCheesePizza(Pizza):
+    def __init__(self):
+        super().__init__(name="NY Style Sauce and Cheese Pizza",
+                         dough="Thin Crust Dough",
+                         sauce="Marinara Sauce",
+                         toppings=["Grated Reggiano Cheese"])
+
+
+# Concrete Product
+class ChicagoStyleCheesePizza(Pizza):
+    def __init__(self):
+        super().__init__(name="Chicago Style Deep Dish Cheese Pizza",
+                         dough="Extra Thick Crust Dough",
+                         sauce="Plum Tomato Sauce",
+                         toppings=["Shredded Mozarella Cheese"])
+
+    def cut(self):
+        sys.stdout.write(_SQUARE_CUT_MSG)
 
 
 # Creator
 class PizzaStore(ABC):
+    # Concrete creators declare which pizzas they make.
+    # Pizza type keys are normalized to lower case when the subclass is defined.
+    STYLE: str = ""
+
+    @property
     @abstractmethod
+    def PIZZAS(self) -> dict[str, type[Pizza]]:
+        """Maps pizza types to the pizza classes this store makes."""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        pizzas = cls.__dict__.get("PIZZAS")
+        if isinstance(pizzas, dict):
+            cls.PIZZAS = {sys.intern(name.lower()): ctor for name, ctor in pizzas.items()}
+
     def create_pizza(self, pizza_type: str) -> Pizza:
-        pass
+        ctor = self.PIZZAS.get(pizza_type)
+        if ctor is None:
+            # only pay for lowercasing if the type was not given in canonical form
+            pizza_type = pizza_type.lower()
+            ctor = self.PIZZAS.get(pizza_type)
+            if ctor is None:
+                style = f"{self.STYLE} " if self.STYLE else ""
+                raise ValueError(f"Don't know how to create {style}{pizza_type} pizza")
+        return ctor()
 
     def order_pizza(self, pizza_type: str) -> Pizza:
         pizza = self.create_pizza(pizza_type)
@@ -52,47 +101,14 @@ class PizzaStore(ABC):
 
 # Concrete Creator
 class NyPizzaStore(PizzaStore):
-    def create_pizza(self, pizza_type: str) -> Pizza:
-        pizza_type = pizza_type.lower()
-        if pizza_type == "cheese":
-            return NyStyleCheesePizza()
-        if pizza_type == "veggie":
-            return NyStyleVeggiePizza()
-        else:
-            raise ValueError(f"Don't know how to create New York style {pizza_type} pizza")
+    STYLE = "New York Style"
+    PIZZAS = {_CHEESE: NyStyleCheesePizza}
 
 
 # Concrete Creator
 class ChicagoPizzaStore(PizzaStore):
-    def create_pizza(self, pizza_type: str) -> Pizza:
-        pizza_type = pizza_type.lower()
-        if pizza_type == "cheese":
-            return ChicagoStyleCheesePizza()
-        if pizza_type == "veggie":
-            return ChicagoStyleVeggiePizza()
-        else:
-            raise ValueError(f"Don't know how to create Chicago style {pizza_type} pizza")
-
-
-# Concrete Product
-class NyStyleCheesePizza(Pizza):
-    def __init__(self):
-        super().__init__(name="NY Style Sauce and Cheese Pizza",
-                         dough="Thin Crust Dough",
-                         sauce="Marinara Sauce",
-                         toppings=["Grated Reggiano Cheese"])
-
-
-# Concrete Product
-class ChicagoStyleCheesePizza(Pizza):
-    def __init__(self):
-        super().__init__(name="Chicago Style Deep Dish Cheese Pizza",
-                         dough="Extra Thick Crust Dough",
-                         sauce="Plum Tomato Sauce",
-                         toppings=["Shredded Mozarella Cheese"])
-
-    def cut(self):
-        print("Cutting the pizza into square slices")
+    STYLE = "Chicago Style"
+    PIZZAS = {_CHEESE: ChicagoStyleCheesePizza}
 
 
 if __name__ == '__main__':
@@ -8,22 +8,213 @@ callable (with matching signature). This allows simple functions to serve as
 observers as well as traditional objects. It requires slightly more work when
 registering an observer because one has to choose which method should receive
 the notifications.
+
+Observers are stored in the keys of a dict, which keeps them in registration
+order while making (un)registration O(1). Registering the same observer twice
+has no effect. Bound methods are held weakly (via `WeakMethod`): a Subject does
+not keep the object they belong to alive, and they are dropped automatically
+when that object is garbage collected. All other callables (functions, lambdas,
+closures, `functools.partial`, ...) and methods of objects that do not support
+weak references are held strongly and stay registered until they are
+unregistered.
+
+Observers are usually registered once and notified many times. Therefore,
+`notify_observers` runs a function generated for the current set of observers
+that calls each of them in turn without a loop. The function is regenerated
+lazily after the set of observers changes.
 """
+import dataclasses
+import functools
+import gc
+import inspect
+from weakref import WeakMethod
+
+
+class _StrongRef:
+    """Counterpart of `weakref.ref` that keeps its referent alive."""
+
+    __slots__ = ("observer",)
+
+    def __init__(self, observer):
+        self.observer = observer
+
+    def __call__(self):
+        return self.observer
+
+    def __eq__(self, other):
+        return isinstance(other, _StrongRef) and self.observer == other.observer
+
+    def __hash__(self):
+        return hash(self.observer)
+
+
+class _WeakMethodRef:
+    """Weak reference to a bound method.
+
+    Unlike `WeakMethod`, which hashes and compares the bound objects by value,
+    this compares them by identity, just like bound methods do. This keeps
+    methods of unhashable objects and of distinct but equal objects apart.
+    """
+
+    __slots__ = ("method_ref", "obj_id", "func")
+
+    def __init__(self, method, callback):
+        # raises TypeError if the method's object does not support weak references
+        self.method_ref = WeakMethod(method, lambda _: callback(self))
+        self.obj_id = id(method.__self__)
+        self.func = method.__func__
+
+    def __call__(self):
+        return self.method_ref()
+
+    def __eq__(self, other):
+        if not isinstance(other, _WeakMethodRef) or self.func is not other.func:
+            return False
+        method, other_method = self.method_ref(), other.method_ref()
+        if method is None or other_method is None:
+            return self is other
+        return method.__self__ is other_method.__self__
+
+    def __hash__(self):
+        return hash((self.obj_id, self.func))
 
 
 class Subject:
     def __init__(self):
-        self.observers = []
+        self.observers = {}
+        self._notify = None
 
     def register_observer(self, observer):
-        self.observers.append(observer)
+        self.observers[self._ref(observer)] = None
+        self._notify = None
 
     def unregister_observer(self, observer):
-        self.observers.remove(observer)
+        self.observers.pop(self._ref(observer), None)
+        self._notify = None
+
+    def _ref(self, observer):
+        if inspect.ismethod(observer):
+            try:
+                return _WeakMethodRef(observer, self._discard)
+            except TypeError:
+                pass  # the method's object does not support weak references
+        return _StrongRef(observer)
+
+    def _discard(self, observer_ref):
+        self.observers.pop(observer_ref, None)
+        self._notify = None
 
     def notify_observers(self):
-        for observer in self.observers:
-            observer(self)
+        if self._notify is None:
+            self._notify = self._compile_notify()
+        # the generated function works on a snapshot of the observers, so
+        # observers may unregister during notification
+        self._notify(self)
+
+    def _compile_notify(self):
+        namespace = {f"_ref{i}": observer_ref for i, observer_ref in enumerate(self.observers)}
+        lines = ["def notify(subject):"]
+        for name in namespace:
+            lines.append(f"    observer = {name}()")
+            lines.append("    if observer is not None:")
+            lines.append("        observer(subject)")
+        if not namespace:
+            lines.append("    pass")
+        exec(compile("\n".join(lines), "<observer>", "exec"), namespace)
+        return namespace["notify"]
+
+
+def test_notify_callables_without_other_owner():
+    calls = []
+
+    def record(tag, subject):
+        calls.append(tag)
+
+    subject = Subject()
+    subject.register_observer(lambda s: calls.append('lambda'))
+    subject.register_observer(functools.partial(record, 'partial'))
+    subject.notify_observers()
+    assert calls == ['lambda', 'partial']
+
+
+def test_notify_callable_without_weakref_support():
+    class SlottedObserver:
+        __slots__ = ('calls',)
+
+        def __init__(self):
+            self.calls = 0
+
+        def __call__(self, subject):
+            self.calls += 1
+
+    observer = SlottedObserver()
+    subject = Subject()
+    subject.register_observer(observer)
+    subject.register_observer(observer.__call__)
+    subject.notify_observers()
+    subject.unregister_observer(observer)
+    subject.unregister_observer(observer.__call__)
+    subject.notify_observers()
+    assert observer.calls == 2
+
+
+def test_bound_method_dropped_with_its_object():
+    class Observer:
+        calls = 0
+
+        def notify(self, subject):
+            Observer.calls += 1
+
+    observer = Observer()
+    subject = Subject()
+    subject.register_observer(observer.notify)
+    subject.notify_observers()
+    del observer
+    gc.collect()
+    subject.notify_observers()
+    assert Observer.calls == 1
+    assert not subject.observers
+
+
+def test_bound_method_of_unhashable_object():
+    @dataclasses.dataclass
+    class View:
+        calls: int = 0
+
+        def on_change(self, subject):
+            self.calls += 1
+
+    view = View()
+    subject = Subject()
+    subject.register_observer(view.on_change)
+    subject.notify_observers()
+    subject.unregister_observer(view.on_change)
+    subject.notify_observers()
+    assert view.calls == 1
+
+
+def test_bound_methods_of_equal_objects():
+    class Observer:
+        def __init__(self):
+            self.calls = 0
+
+        def __eq__(self, other):
+            return isinstance(other, Observer)
+
+        def __hash__(self):
+            return 0
+
+        def notify(self, subject):
+            self.calls += 1
+
+    a, b = Observer(), Observer()
+    subject = Subject()
+    subject.register_observer(a.notify)
+    subject.register_observer(b.notify)
+    subject.notify_observers()
+    subject.unregister_observer(b.notify)
+    subject.notify_observers()
+    assert (a.calls, b.calls) == (2, 1)
 
 
 if __name__ == '__main__':
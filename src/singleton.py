@@ -27,9 +27,12 @@ class SimpleSingleton:
     _the_instance = None
 
     def __new__(cls):
-        if cls._the_instance is None:
-            cls._the_instance = super().__new__(cls)
-        return cls._the_instance
+        inst = cls.__dict__.get('_the_instance')
+        if inst is not None:
+            return inst
+        inst = object.__new__(cls)
+        cls._the_instance = inst
+        return inst
 
 
 def singleton():
@@ -54,12 +57,11 @@ def make_singleton_meta():
     class SingletonMetaClass(type):
 
         def __call__(cls, *args, **kwargs):
-            try:
-                return instances[cls]
-            except KeyError:
+            instance = instances.get(cls)
+            if instance is None:
                 instance = super().__call__(*args, **kwargs)
                 instances[cls] = instance
-                return instance
+            return instance
 
     return SingletonMetaClass
 
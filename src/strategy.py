@@ -5,22 +5,23 @@ Strategy Pattern
 I prefer to use first class functions to implement Strategies because it makes
 the code terser in general.
 """
+import itertools
+import sys
 
 
-def no_quack(): print("...")
+def no_quack(): sys.stdout.write("...\n")
 
 
-def squeak(): print("squeak")
+def squeak(): sys.stdout.write("squeak\n")
 
 
 class NormalQuack:
     def __init__(self):
-        self.cycle = ["quack", "quaaaak", "QUACK!"]
-        self.idx = -1
+        self.cycle = ("quack\n", "quaaaak\n", "QUACK!\n")
+        self._iter = itertools.cycle(self.cycle)
 
     def do_quack(self):
-        self.idx = (self.idx + 1) % len(self.cycle)
-        print(self.cycle[self.idx])
+        sys.stdout.write(next(self._iter))
 
 
 class Duck: